@@ -227,6 +227,7 @@ class KeithleyDMM6500:
         self._resource_manager: Optional[pyvisa.ResourceManager] = None
         self._instrument: Any = None  # pyvisa Resource object (use Any to avoid type errors)
         self._is_connected = False
+        self._binary_transfer = False  # True once :FORMat:DATA REAL is active
 
         # Initialize logging for this instance
         self._logger = logging.getLogger(f'{self.__class__.__name__}.{id(self)}')
@@ -329,6 +330,63 @@ class KeithleyDMM6500:
             self._cleanup_connection()
             raise KeithleyDMM6500Error(f"Connection failed: {e}") from e
 
+    def enable_binary_transfer(self, chunk_size: int = 102400) -> bool:
+        """
+        Switch reading transfers to binary double precision and enlarge VISA reads.
+
+        With :FORMat:DATA REAL the instrument returns readings as IEEE 488.2
+        definite-length blocks of 64-bit floats, removing the ASCII
+        formatting/parsing cost on both ends, and a larger chunk_size lets
+        buffer dumps complete in fewer low-level reads. Falls back to ASCII
+        if the instrument rejects the format command.
+
+        Args:
+            chunk_size: Minimum VISA read chunk size in bytes
+
+        Returns:
+            True if binary transfer is active, False if ASCII remains in use
+
+        Note:
+            Individual reads get faster, so a long timeout_ms mostly matters
+            for high-NPLC or triggered acquisitions; it can usually be lowered.
+        """
+        if not self._is_connected:
+            return False
+
+        self._instrument.chunk_size = max(self._instrument.chunk_size, chunk_size)
+
+        try:
+            self._instrument.write(":FORMat:DATA REAL")
+            self._instrument.write(":FORMat:BORDer NORMal")  # Big-endian, as parsed below
+            error_response = self._instrument.query(":SYSTem:ERRor:NEXT?").strip()
+            if not error_response.startswith("0"):
+                raise KeithleyDMM6500Error(error_response)
+            self._binary_transfer = True
+            self._logger.info("Binary (REAL,64) reading transfer enabled")
+        except Exception as e:
+            self._logger.warning(f"Binary transfer not available, staying with ASCII: {e}")
+            try:
+                self._instrument.write(":FORMat:DATA ASCii")
+                self._instrument.write("*CLS")
+            except Exception:
+                pass
+            self._binary_transfer = False
+
+        return self._binary_transfer
+
+    def _query_readings(self, command: str) -> List[float]:
+        """Query one or more readings in the active transfer format."""
+        if self._binary_transfer:
+            return self._instrument.query_binary_values(command, datatype='d', is_big_endian=True)
+        response = self._instrument.query(command)
+        return [float(x) for x in response.split(',') if x.strip()]
+
+    def _query_reading(self, command: str) -> float:
+        """Query a single reading in the active transfer format."""
+        if self._binary_transfer:
+            return self._query_readings(command)[0]
+        return float(self._instrument.query(command).strip())
+
     def disconnect(self) -> None:
         """
         Safely disconnect from multimeter and release resources.
@@ -448,10 +506,9 @@ class KeithleyDMM6500:
             time.sleep(0.2)
 
             self._logger.debug("Performing fresh DC voltage reading")
-            measurement_str = self._instrument.query(":READ?")
-            voltage = float(measurement_str.strip())
+            voltage = self._query_reading(":READ?")
 
-            self._logger.info(f"DC voltage measurement successful: {voltage:.9f} V")
+            self._logger.info("DC voltage measurement successful: %.9f V", voltage)
 
             return voltage
 
@@ -497,10 +554,9 @@ class KeithleyDMM6500:
             time.sleep(0.05)
 
             # Fresh measurement
-            measurement_str = self._instrument.query(":READ?")
-            voltage = float(measurement_str.strip())
+            voltage = self._query_reading(":READ?")
 
-            self._logger.debug(f"Fast DC voltage measurement: {voltage:.6f} V")
+            self._logger.debug("Fast DC voltage measurement: %.6f V", voltage)
 
             return voltage
 
@@ -566,7 +622,7 @@ class KeithleyDMM6500:
                 voltage = self.measure_dc_voltage_fast()
                 if voltage is not None:
                     measurements.append(voltage)
-                    self._logger.debug(f"Measurement {i+1}/{measurement_count}: {voltage:.6f}V")
+                    self._logger.debug("Measurement %s/%s: %.6fV", i+1, measurement_count, voltage)
 
                     # Wait between measurements if not the last one
                     if i < measurement_count - 1:
@@ -782,10 +838,9 @@ class KeithleyDMM6500:
             # Removed :TRACe:CLEar to avoid -113 on models lacking TRACE buffer
 
             # Perform measurement
-            value_str = self._instrument.query(":READ?")
-            value = float(value_str.strip())
+            value = self._query_reading(":READ?")
 
-            self._logger.info(f"Measurement {func_token} successful: {value:.9f}")
+            self._logger.info("Measurement %s successful: %.9f", func_token, value)
             return value
 
         except VisaIOError as e:
@@ -1038,9 +1093,8 @@ class KeithleyDMM6500:
             return None
 
         try:
-            result = self._instrument.query(":FETCh?")
-            value = float(result.strip())
-            self._logger.debug(f"Fetched measurement: {value}")
+            value = self._query_reading(":FETCh?")
+            self._logger.debug("Fetched measurement: %s", value)
             return value
         except Exception as e:
             self._logger.error(f"Failed to fetch measurement: {e}")
@@ -1063,6 +1117,33 @@ class KeithleyDMM6500:
         self._logger.debug("Abort called but :ABORt not supported on this model")
         return True
 
+    def restore_single_measurement_mode(self, buffer_name: str = "defbuffer1") -> bool:
+        """
+        Undo a buffered timer sweep so single :READ? measurements behave normally.
+
+        Buffered acquisition leaves the trigger model on the TIMER source with
+        a sweep-sized count and the buffer in ONCE fill mode. Since :ABORt is
+        not available on this model, the power-on defaults are written back
+        instead: immediate trigger with count 1 and no delay, and the buffer
+        at its default 100000 readings in CONTINUOUS fill mode.
+
+        Args:
+            buffer_name: Buffer used by the sweep (default: "defbuffer1")
+
+        Returns:
+            True if both trigger and buffer were restored
+        """
+        if not self._is_connected:
+            return False
+
+        try:
+            self.configure_trigger(TriggerSource.IMMEDIATE, count=1, delay=0.0)
+            self.configure_buffer(buffer_name, buffer_size=100000, fill_mode="CONTINUOUS")
+            return True
+        except KeithleyDMM6500Error as e:
+            self._logger.error(f"Failed to restore single-measurement mode: {e}")
+            return False
+
     # ========================================================================
     # BUFFER/TRACE SUBSYSTEM - Data logging and retrieval
     # ========================================================================
@@ -1196,7 +1277,8 @@ class KeithleyDMM6500:
                     self._logger.warning(f"Buffer {buffer_name} is empty")
                     return None
 
-                # Get statistics from instrument
+                # Get statistics from instrument (always ASCII; :FORMat:DATA only
+                # applies to readings, so these bypass _query_reading)
                 mean = float(self._instrument.query(f":TRACe:STATistics:AVERage? \"{buffer_name}\"").strip())
                 stddev = float(self._instrument.query(f":TRACe:STATistics:STDDev? \"{buffer_name}\"").strip())
                 minimum = float(self._instrument.query(f":TRACe:STATistics:MINimum? \"{buffer_name}\"").strip())
@@ -1223,6 +1305,25 @@ class KeithleyDMM6500:
             self._logger.error(f"Failed to get buffer statistics: {e}")
             return None
 
+    def get_buffer_count(self, buffer_name: str = "defbuffer1") -> Optional[int]:
+        """
+        Get the number of readings currently stored in a buffer.
+
+        Args:
+            buffer_name: Buffer to query (default: "defbuffer1")
+
+        Returns:
+            Reading count, or None on failure
+        """
+        if not self._is_connected:
+            return None
+
+        try:
+            return int(self._instrument.query(f":TRACe:ACTual? \"{buffer_name}\"").strip())
+        except Exception as e:
+            self._logger.error(f"Failed to query buffer count for {buffer_name}: {e}")
+            return None
+
     def fetch_buffer_data(self,
                          buffer_name: str = "defbuffer1",
                          start_index: int = 1,
@@ -1242,8 +1343,8 @@ class KeithleyDMM6500:
             List of measurement values, or None on failure
 
         Note:
-            For high-speed acquisition with 100k+ samples, consider using
-            binary transfer format or chunked retrieval to avoid timeouts.
+            For high-speed acquisition with 100k+ samples, call
+            enable_binary_transfer() or use chunked retrieval to avoid timeouts.
         """
         if not self._is_connected:
             return None
@@ -1262,12 +1363,10 @@ class KeithleyDMM6500:
 
                 # Fetch data from buffer
                 query_cmd = f":TRACe:DATA? {start_index}, {end_index}, \"{buffer_name}\", READ"
-                data_str = self._instrument.query(query_cmd)
-
-                # Parse comma-separated values
-                values = [float(x.strip()) for x in data_str.split(',') if x.strip()]
+                # Binary block or comma-separated values, per active format
+                values = self._query_readings(query_cmd)
 
-                self._logger.info(f"Retrieved {len(values)} readings from {buffer_name}")
+                self._logger.info("Retrieved %s readings from %s", len(values), buffer_name)
                 return values
             except Exception as e:
                 self._logger.warning(f"TRACe commands not supported on this model: {e}")
@@ -1278,6 +1377,90 @@ class KeithleyDMM6500:
             self._logger.error(f"Failed to fetch buffer data: {e}")
             return None
 
+    # ========================================================================
+    # SERVICE REQUEST - Event-driven completion of triggered sweeps
+    # ========================================================================
+
+    def enable_completion_srq(self) -> bool:
+        """
+        Raise a service request when a triggered sweep completes.
+
+        Uses the IEEE 488.2 status model: *ESE 1 lets the operation-complete
+        bit set ESB in the status byte and *SRE 32 asserts SRQ on ESB, so
+        initiate_with_completion() (':INITiate;*OPC') requests service once
+        the trigger model has taken all its readings. VISA service-request
+        events are queued on the session for wait_for_srq().
+
+        Returns:
+            True if enabled; False if the interface cannot deliver SRQ
+            events (e.g. raw TCP sockets), in which case callers poll
+        """
+        if not self._is_connected:
+            return False
+
+        try:
+            self._instrument.enable_event(pyvisa.constants.EventType.service_request,
+                                          pyvisa.constants.EventMechanism.queue)
+            self._instrument.write("*CLS;*ESE 1;*SRE 32")
+            return True
+        except Exception as e:
+            self._logger.debug(f"Service requests unavailable on this interface: {e}")
+            return False
+
+    def disable_completion_srq(self) -> None:
+        """Undo enable_completion_srq(); errors are ignored (best-effort cleanup)."""
+        if not self._is_connected:
+            return
+
+        try:
+            self._instrument.write("*SRE 0;*ESE 0")
+            self._instrument.disable_event(pyvisa.constants.EventType.service_request,
+                                           pyvisa.constants.EventMechanism.queue)
+        except Exception as e:
+            self._logger.debug(f"Failed to disable service requests: {e}")
+
+    def initiate_with_completion(self) -> bool:
+        """
+        Clear status, start the trigger model and arm operation-complete.
+
+        With enable_completion_srq() active, the instrument requests service
+        when this sweep finishes; nothing is read back until then.
+
+        Returns:
+            True if the command was sent
+        """
+        if not self._is_connected:
+            raise KeithleyDMM6500Error("Multimeter not connected")
+
+        try:
+            self._instrument.write("*CLS;:INITiate;*OPC")
+            return True
+        except Exception as e:
+            self._logger.error(f"Failed to initiate measurement: {e}")
+            return False
+
+    def wait_for_srq(self, timeout_s: float) -> bool:
+        """
+        Block until the instrument requests service, without bus traffic.
+
+        Args:
+            timeout_s: Longest time to wait in seconds
+
+        Returns:
+            True if a service request arrived (the status byte is then read
+            by serial poll to release SRQ), False on timeout or when not
+            connected
+        """
+        if not self._is_connected:
+            return False
+
+        response = self._instrument.wait_on_event(pyvisa.constants.EventType.service_request,
+                                                  int(timeout_s * 1000), capture_timeout=True)
+        if response.timed_out:
+            return False
+        self._instrument.read_stb()
+        return True
+
     # ========================================================================
     # DISPLAY CONTROL - Front panel display management
     # ========================================================================
@@ -1685,6 +1868,7 @@ class KeithleyDMM6500:
     def _cleanup_connection(self) -> None:
         """Clean up connection state and references."""
         self._is_connected = False
+        self._binary_transfer = False
         self._instrument = None
         self._resource_manager = None
 
@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 """
 Keithley Power Supply Control Library - CONSOLIDATED FINAL
-- No lock
+- Per-instance I/O lock around channel-select transactions
+- Voltage and current read with one chained SCPI query
+- Optional instrument-timed source list for voltage profiles
+- Pre-formatted setpoint commands for host-paced profiles
 - Robust I/O recovery
 - Buffer drain and explicit write/read
 - Consistent terminations and timeouts
 """
 
+import functools
 import logging
+import threading
 import time
 import re
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import pyvisa
@@ -21,6 +26,36 @@ class KeithleyPowerSupplyError(Exception):
     pass
 
 
+# Numeric token in a SCPI response ("1.2345", "-3E-3", "+0.000000E+00", ...)
+_NUMBER_RE = re.compile(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?')
+
+# Voltage and current of the selected channel in one VISA round-trip.
+# IEEE 488.2 lets queries be chained with ';' and the instrument answers
+# with both responses in the same message ("<volts>;<amps>").
+_MEASURE_VI_QUERY = ":MEASure:VOLTage?;:MEASure:CURRent?"
+
+# Voltage, current and output state of the selected channel in one round-trip.
+# Channel selection is written separately so the channel-switch settle time
+# can elapse before the readings are taken.
+_MEASURE_VI_STATE_QUERY = ":MEASure:VOLTage?;:MEASure:CURRent?;:OUTPut?"
+
+
+def _serialized(method):
+    """
+    Hold the instance I/O lock for the whole method.
+
+    Most channel operations are a ':INSTrument:SELect CHn' followed by further
+    commands/queries that act on the *selected* channel. If two threads
+    interleave, one of them reads or programs the wrong channel, so each such
+    transaction runs under the driver's re-entrant lock.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._io_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class OutputState(Enum):
     ENABLED = "ENABLED"
     DISABLED = "DISABLED"
@@ -62,6 +97,7 @@ class KeithleyPowerSupply:
         self._instrument: Any = None  # pyvisa Resource object (use Any to avoid type errors)
 
         self._logger = logging.getLogger(f'{self.__class__.__name__}.{id(self)}')
+        self._io_lock = threading.RLock()  # Serializes channel-select transactions
 
         self.max_channels = 3
         self.max_voltage = 30.0
@@ -77,6 +113,13 @@ class KeithleyPowerSupply:
         self._valid_current_range = (0.001, 3.0)
         self._valid_ovp_range = (1.0, 35.0)
 
+        self._max_list_points = 2500  # Longest profile sent as one source list
+
+        self._channel_settle_time = 0.3  # After ':INSTrument:SELect' before measuring
+        self._compound_measure_ok: Optional[bool] = None  # Chained V/I/state query usable?
+                                                          # (None until first probed)
+        self._compound_probe_timeout_ms = 2000  # Query timeout while that is unknown
+
     @property
     def is_connected(self) -> bool:
         return self._is_connected and self._instrument is not None
@@ -107,6 +150,7 @@ class KeithleyPowerSupply:
             time.sleep(self._reset_time)
             self._instrument.query("*OPC?")
 
+            self._compound_measure_ok = None  # Re-probe on the (possibly different) instrument
             self._is_connected = True
             self._logger.info(f"Successfully connected to Keithley {self.model}")
             return True
@@ -204,6 +248,7 @@ class KeithleyPowerSupply:
             self._logger.error(f"Failed to get instrument info: {e}")
             return None
 
+    @_serialized
     def configure_channel(self, channel: int, voltage: float, current_limit: float, ovp_level: float, enable_output: bool = False) -> bool:
         if not self.is_connected:
             self._logger.error("Cannot configure channel: not connected")
@@ -240,6 +285,7 @@ class KeithleyPowerSupply:
             self._logger.error(f"Failed to configure channel {channel}: {e}")
             return False
 
+    @_serialized
     def enable_channel_output(self, channel: int) -> bool:
         if not self.is_connected:
             self._logger.error("Cannot enable output: not connected")
@@ -263,6 +309,7 @@ class KeithleyPowerSupply:
             self._logger.error(f"Enable output failed on CH{channel}: {e}")
             return False
 
+    @_serialized
     def disable_channel_output(self, channel: int) -> bool:
         if not self.is_connected:
             self._logger.error("Cannot disable output: not connected")
@@ -301,6 +348,7 @@ class KeithleyPowerSupply:
             self._logger.warning("Some outputs may still be ON")
         return ok
 
+    @_serialized
     def set_voltage(self, channel: int, voltage: float) -> bool:
         """
         Set voltage on a specific channel without changing other parameters.
@@ -327,9 +375,10 @@ class KeithleyPowerSupply:
         try:
             # Use APPLY command which directly sets voltage on specific channel
             # This is more reliable than SELECT + SOURCE pattern for multi-channel
-            # Format: APPLY CH{channel},{voltage}
+            # Format: APPLY CH{channel},{voltage} (fixed 6 decimals, so computed
+            # float64 setpoints never go out as long repr strings)
 
-            self._instrument.write(f":APPLY CH{channel},{voltage}")
+            self._instrument.write(f":APPLY CH{channel},{voltage:.6f}")
             time.sleep(0.1)  # Delay for command to complete
 
             self._logger.debug(f"CH{channel} voltage set to {voltage:.4f}V using APPLY")
@@ -338,6 +387,150 @@ class KeithleyPowerSupply:
             self._logger.error(f"Failed to set voltage on channel {channel}: {e}")
             return False
 
+    def voltage_setpoint_commands(self, channel: int, voltages: Sequence[float]) -> Optional[List[str]]:
+        """
+        Pre-format a host-paced voltage profile as ':APPLY' commands.
+
+        Channel and range are validated once for the whole profile, and each
+        setpoint is rendered the same way set_voltage() renders it. The
+        returned strings are then sent one per point with write_setpoint(),
+        so the timing loop does no per-point validation or formatting.
+
+        Args:
+            channel: Channel number (1-max_channels)
+            voltages: Setpoints in volts, in playback order
+
+        Returns:
+            One command per setpoint, or None if the channel or any voltage is invalid
+        """
+        if not (1 <= channel <= self.max_channels):
+            self._logger.error(f"Invalid channel {channel}")
+            return None
+
+        low, high = self._valid_voltage_range
+        if len(voltages) and (min(voltages) < low or max(voltages) > high):
+            self._logger.error(f"Profile voltages out of range {self._valid_voltage_range}")
+            return None
+
+        prefix = f":APPLY CH{channel},"
+        return [f"{prefix}{v:.6f}" for v in voltages]
+
+    @_serialized
+    def write_setpoint(self, command: str) -> bool:
+        """
+        Send one command from voltage_setpoint_commands().
+
+        Unlike set_voltage() there is no fixed post-write delay: the caller
+        paces the profile against its own schedule. The write holds the I/O
+        lock so it cannot land inside another thread's channel-select
+        transaction (e.g. a live measurement) on the same session.
+        """
+        if not self.is_connected:
+            self._logger.error("Cannot write setpoint: not connected")
+            return False
+
+        try:
+            self._instrument.write(command)
+            return True
+        except Exception as e:
+            self._logger.error(f"Failed to write setpoint '{command}': {e}")
+            return False
+
+    @_serialized
+    def program_voltage_list(self, channel: int, voltages: Sequence[float], interval_s: float) -> bool:
+        """
+        Upload a voltage profile as a source list and start it on the timer trigger.
+
+        The instrument then steps through the list itself, one point every
+        interval_s, instead of the host sending one ':APPLY' per point.
+        Support is probed rather than assumed: the upload is followed by
+        ':SYSTem:ERRor?', and if the instrument rejected any command the
+        channel is returned to fixed mode and False is returned so the
+        caller can fall back to host-paced set_voltage() writes.
+
+        Args:
+            channel: Channel number (1-max_channels)
+            voltages: Setpoints in volts, in playback order
+            interval_s: Dwell time per point in seconds
+
+        Returns:
+            True if the list was accepted and started, False otherwise
+        """
+        if not self.is_connected:
+            self._logger.error("Cannot program list: not connected")
+            return False
+
+        if not (1 <= channel <= self.max_channels):
+            self._logger.error(f"Invalid channel {channel}")
+            return False
+
+        n_points = len(voltages)
+        if not (0 < n_points <= self._max_list_points):
+            self._logger.info(f"List mode skipped: {n_points} points (limit {self._max_list_points})")
+            return False
+
+        low, high = self._valid_voltage_range
+        if min(voltages) < low or max(voltages) > high:
+            self._logger.error(f"List voltages out of range {self._valid_voltage_range}")
+            return False
+
+        try:
+            self._instrument.write("*CLS")
+            self._instrument.write(f":INSTrument:SELect CH{channel}")
+            self._instrument.write(":SOURce:LIST:VOLTage " + ",".join(f"{v:.6f}" for v in voltages))
+            self._instrument.write(":TRIGger:SOURce TIMer")
+            self._instrument.write(f":TRIGger:TIMer {interval_s:.6f}")
+            self._instrument.write(f":TRIGger:COUNt {n_points}")
+            self._instrument.write(":SOURce:VOLTage:MODE LIST")
+
+            error_str = self._instrument.query(":SYSTem:ERRor?").strip()
+            if not error_str.startswith(("0", "+0")):
+                self._logger.info(f"List mode not supported on CH{channel}: {error_str}")
+                self._restore_fixed_mode()
+                self._instrument.write("*CLS")
+                return False
+
+            self._instrument.write(":INITiate")
+            self._logger.info(f"CH{channel} running {n_points}-point list at {interval_s:.4f}s/point")
+            return True
+        except Exception as e:
+            self._logger.error(f"Failed to program voltage list on channel {channel}: {e}")
+            return False
+
+    @_serialized
+    def abort_voltage_list(self, channel: int) -> bool:
+        """
+        Stop a running source list and return the channel to fixed-voltage mode.
+
+        Safe to call after the list has finished on its own; the output stays
+        at the last list voltage until the next set_voltage().
+        """
+        if not self.is_connected:
+            return False
+
+        try:
+            self._instrument.write(f":INSTrument:SELect CH{channel}")
+            self._instrument.write(":ABORt")
+            self._restore_fixed_mode()
+            return True
+        except Exception as e:
+            self._logger.error(f"Failed to abort voltage list on channel {channel}: {e}")
+            return False
+
+    def _restore_fixed_mode(self) -> None:
+        """
+        Undo the source/trigger settings made by program_voltage_list().
+
+        Returns the selected channel to fixed-voltage mode and the trigger
+        subsystem to its defaults (immediate source, count 1), so the timer
+        trigger does not stay armed for later commands. Caller holds the
+        I/O lock.
+        """
+        self._instrument.write(":SOURce:VOLTage:MODE FIXed")
+        self._instrument.write(":TRIGger:SOURce IMMediate")
+        self._instrument.write(":TRIGger:COUNt 1")
+
+    @_serialized
     def measure_voltage(self, channel: int) -> Optional[float]:
         """
         Measure voltage on a specific channel.
@@ -374,6 +567,7 @@ class KeithleyPowerSupply:
             self._logger.error(f"Failed to measure voltage on channel {channel}: {e}")
             return None
 
+    @_serialized
     def measure_current(self, channel: int) -> Optional[float]:
         """
         Measure current on a specific channel.
@@ -421,6 +615,23 @@ class KeithleyPowerSupply:
             self._logger.error(f"Failed to measure current on channel {channel}: {e}")
             return None
 
+    def _query_voltage_and_current(self) -> Tuple[float, float]:
+        """Read (voltage, current) of the selected channel; caller holds the I/O lock."""
+        response = self._instrument.query(_MEASURE_VI_QUERY).strip()
+        self._logger.debug(f"Raw V/I response: '{response}'")
+        matches = _NUMBER_RE.findall(response)
+        if len(matches) >= 2:
+            return float(matches[0]), float(matches[1])
+
+        # Instrument did not answer the chained query in full; fall back to
+        # a separate current query so the reading is still usable
+        self._logger.warning(f"Could not parse V/I pair from '{response}', querying current separately")
+        voltage = float(matches[0]) if matches else 0.0
+        current_matches = _NUMBER_RE.findall(self._instrument.query(":MEASure:CURRent?").strip())
+        current = float(current_matches[0]) if current_matches else 0.0
+        return voltage, current
+
+    @_serialized
     def measure_channel_output(self, channel: int) -> Optional[Tuple[float, float]]:
         """
         ABSOLUTE FINAL: Improved parsing and buffer management
@@ -451,27 +662,10 @@ class KeithleyPowerSupply:
 
             # Select channel
             self._instrument.write(f":INSTrument:SELect CH{channel}")
-            time.sleep(0.3)  # Increased to 0.3s for reliable channel switching
-
-            # Measure voltage
-            voltage_str = self._instrument.query(":MEASure:VOLTage?").strip()
-            self._logger.info(f"Raw voltage response: '{voltage_str}'")
-            time.sleep(0.2)  # Increased to 0.2s between measurements
-
-            # Measure current
-            current_str = self._instrument.query(":MEASure:CURRent?").strip()
-            self._logger.info(f"Raw current response: '{current_str}'")
-
-            # Better number parsing
-            def extract_first_float(s: str) -> float:
-                matches = re.findall(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?', s)
-                if matches:
-                    return float(matches[0])
-                self._logger.warning(f"Could not parse number from '{s}', returning 0.0")
-                return 0.0
+            time.sleep(self._channel_settle_time)  # 0.3s for reliable channel switching
 
-            voltage = extract_first_float(voltage_str)
-            current = extract_first_float(current_str)
+            # Measure voltage and current in one chained query
+            voltage, current = self._query_voltage_and_current()
 
             # Check output state and sanitize current if OFF
             try:
@@ -505,6 +699,92 @@ class KeithleyPowerSupply:
             except Exception as restore_err:
                 self._logger.debug(f"Failed to restore timeout: {restore_err}")
 
+    def _discard_pending_io(self) -> None:
+        """Device-clear the session and clear status after a failed or partial query (best effort)."""
+        try:
+            self._instrument.clear()
+        except Exception as e:
+            self._logger.debug(f"Device clear failed: {e}")
+        try:
+            self._instrument.write("*CLS")
+        except Exception as e:
+            self._logger.debug(f"*CLS failed: {e}")
+
+    @_serialized
+    def measure_all_outputs(self) -> List[Optional[Tuple[float, float]]]:
+        """
+        Measure (voltage, current) of every channel with one query per channel.
+
+        For each channel ':INSTrument:SELect CHn' is written, the same
+        _channel_settle_time as measure_channel_output() is allowed, and
+        voltage, current and output state are read with the single chained
+        _MEASURE_VI_STATE_QUERY. Compared with measure_channel_output() per
+        channel this drops the buffer clear, the separate ':OUTPut?' round
+        trip and the timeout save/restore for every channel. Current is
+        forced to 0 for channels whose output is OFF, as there.
+
+        Support for the chained query is probed on the first channel of the
+        first call with a short timeout. If that fails (no reply or the
+        wrong number of fields) the session is cleared, the result is
+        remembered for this connection and measure_channel_output() is used
+        per channel from then on. Once support is confirmed, a failure is an
+        instrument fault: the session is cleared and the remaining channels
+        are None, without a fallback that would wait out more timeouts.
+
+        Returns:
+            List indexed by channel-1; an entry is None if that channel failed
+        """
+        channels = range(1, self.max_channels + 1)
+        if not self.is_connected:
+            self._logger.error("Cannot measure: not connected")
+            return [None for _ in channels]
+
+        if self._compound_measure_ok is False:
+            return [self.measure_channel_output(ch) for ch in channels]
+
+        results: List[Optional[Tuple[float, float]]] = []
+        original_timeout = self._instrument.timeout
+        try:
+            for ch in channels:
+                probing = self._compound_measure_ok is None
+                self._instrument.timeout = self._compound_probe_timeout_ms if probing else 15000
+
+                self._instrument.write(f":INSTrument:SELect CH{ch}")
+                time.sleep(self._channel_settle_time)
+                response = self._instrument.query(_MEASURE_VI_STATE_QUERY).strip()
+                self._logger.debug(f"CH{ch} raw V/I/state response: '{response}'")
+
+                fields = [field.strip() for field in response.split(";")]
+                if len(fields) != 3:
+                    raise ValueError(f"CH{ch}: expected 3 values, got '{response}'")
+                voltage = float(_NUMBER_RE.search(fields[0]).group())
+                current = float(_NUMBER_RE.search(fields[1]).group())
+                if fields[2] in ['0', 'OFF', 'off'] and abs(current) > 0.001:
+                    self._logger.warning(f"CH{ch} output OFF but current={current}A, forcing to 0")
+                    current = 0.0
+                results.append((voltage, current))
+                self._compound_measure_ok = True
+
+            self._logger.info("All channels: " + ", ".join(
+                f"CH{ch} {v:.4f}V/{i:.4f}A" for ch, (v, i) in zip(channels, results)))
+            return results
+
+        except Exception as e:
+            self._discard_pending_io()
+            if self._compound_measure_ok:
+                self._logger.error(f"All-channel measurement failed: {e}")
+                return results + [None] * (len(channels) - len(results))
+            self._logger.warning(f"Chained V/I/state query not usable ({e}), measuring channels one by one")
+            self._compound_measure_ok = False
+        finally:
+            try:
+                self._instrument.timeout = original_timeout
+            except Exception as restore_err:
+                self._logger.debug(f"Failed to restore timeout: {restore_err}")
+
+        return [self.measure_channel_output(ch) for ch in channels]
+
+    @_serialized
     def clear_protection(self, channel: int = None) -> bool:
         """
         Attempt to clear protection trip state (OVP/OCP) for a specific channel or all channels.
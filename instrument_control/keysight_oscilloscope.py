@@ -24,6 +24,28 @@ class KeysightDSOX6004AError(Exception):
 class KeysightDSOX6004A:
     """Keysight DSOX6004A Oscilloscope Control Class with Measurement Features"""
 
+    # ✓ Manual pg 706-714: MEASure:XXXX? source (where source can be FUNCtion1-4)
+    # Query prefixes for math-function measurements; the function number is appended
+    _MATH_MEASURE_COMMANDS = {
+        "FREQ": ":MEASure:FREQuency? FUNCtion",
+        "PERiod": ":MEASure:PERiod? FUNCtion",
+        "VPP": ":MEASure:VPP? FUNCtion",
+        "VAMP": ":MEASure:VAMPlitude? FUNCtion",
+        "VTOP": ":MEASure:VTOP? FUNCtion",
+        "VBASe": ":MEASure:VBASe? FUNCtion",
+        "VAVG": ":MEASure:VAVerage? DISPlay,FUNCtion",
+        "VRMS": ":MEASure:VRMS? DISPlay,DC,FUNCtion",
+        "VMAX": ":MEASure:VMAX? FUNCtion",
+        "VMIN": ":MEASure:VMIN? FUNCtion",
+        "RISE": ":MEASure:RISetime? FUNCtion",
+        "FALL": ":MEASure:FALLtime? FUNCtion",
+        "DUTYcycle": ":MEASure:DUTYcycle? FUNCtion",
+        "NDUTy": ":MEASure:NDUTy? FUNCtion",
+        "OVERshoot": ":MEASure:OVERshoot? FUNCtion",
+        "PWIDth": ":MEASure:PWIDth? FUNCtion",
+        "NWIDth": ":MEASure:NWIDth? FUNCtion"
+    }
+
     def __init__(self, visa_address: str, timeout_ms: int = 60000) -> None:
         """
         Initialize oscilloscope connection parameters
@@ -338,27 +360,7 @@ class KeysightDSOX6004A:
 
         try:
             # Build SCPI command based on measurement type
-            # ✓ Manual pg 706-714: MEASure:XXXX? source (where source can be FUNCtion1-4)
-            
-            cmd_map = {
-                "FREQ": ":MEASure:FREQuency? FUNCtion",
-                "PERiod": ":MEASure:PERiod? FUNCtion",
-                "VPP": ":MEASure:VPP? FUNCtion",
-                "VAMP": ":MEASure:VAMPlitude? FUNCtion",
-                "VTOP": ":MEASure:VTOP? FUNCtion",
-                "VBASe": ":MEASure:VBASe? FUNCtion",
-                "VAVG": ":MEASure:VAVerage? DISPlay,FUNCtion",
-                "VRMS": ":MEASure:VRMS? DISPlay,DC,FUNCtion",
-                "VMAX": ":MEASure:VMAX? FUNCtion",
-                "VMIN": ":MEASure:VMIN? FUNCtion",
-                "RISE": ":MEASure:RISetime? FUNCtion",
-                "FALL": ":MEASure:FALLtime? FUNCtion",
-                "DUTYcycle": ":MEASure:DUTYcycle? FUNCtion",
-                "NDUTy": ":MEASure:NDUTy? FUNCtion",
-                "OVERshoot": ":MEASure:OVERshoot? FUNCtion",
-                "PWIDth": ":MEASure:PWIDth? FUNCtion",
-                "NWIDth": ":MEASure:NWIDth? FUNCtion"
-            }
+            cmd_map = self._MATH_MEASURE_COMMANDS
 
             if measurement_type not in cmd_map:
                 self._logger.error(f"Unknown measurement type: {measurement_type}")
@@ -386,6 +388,66 @@ class KeysightDSOX6004A:
             self._logger.error(f"Measurement failed for MATH{function_num} ({measurement_type}): {e}")
             return None
 
+    def batch_measure_math(self, function_num: int, measurement_types: List[str]) -> Dict[str, float]:
+        """
+        Perform several measurements on a math function in one SCPI exchange
+
+        All queries are chained with ';' into a single program message, so the
+        scope answers with one ';'-separated response instead of one VISA
+        round-trip (plus *OPC? and settle delay) per measurement. If the reply
+        does not hold one field per query it is discarded; types whose value
+        is missing or cannot be parsed are re-measured one at a time with
+        measure_math_single().
+
+        Args:
+            function_num (int): Math function number (1-4)
+            measurement_types (List[str]): List of measurement types
+
+        Returns:
+            Dict[str, float]: Measurement names mapped to values (failed types omitted)
+        """
+        if not self.is_connected:
+            self._logger.error("Cannot measure: oscilloscope not connected")
+            return {}
+
+        if not (1 <= function_num <= 4):
+            self._logger.error(f"Invalid math function: {function_num}")
+            return {}
+
+        known = [m for m in measurement_types if m in self._MATH_MEASURE_COMMANDS]
+        for meas_type in measurement_types:
+            if meas_type not in self._MATH_MEASURE_COMMANDS:
+                self._logger.error(f"Unknown measurement type: {meas_type}")
+        if not known:
+            return {}
+
+        results = {}
+        try:
+            self._scpi_wrapper.query("*OPC?")
+            time.sleep(0.1)
+
+            # batch_query() rejects a reply with the wrong field count, so a
+            # short or misaligned answer is never paired with the wrong type
+            responses = self.batch_query(
+                [f"{self._MATH_MEASURE_COMMANDS[m]}{function_num}" for m in known])
+            for meas_type, response in zip(known, responses):
+                try:
+                    results[meas_type] = float(response)
+                except ValueError:
+                    pass
+        except Exception as e:
+            self._logger.warning(f"Batched measurement failed for MATH{function_num}: {e}")
+
+        # Anything the combined reply did not cover is measured individually
+        for meas_type in known:
+            if meas_type not in results:
+                value = self.measure_math_single(function_num, meas_type)
+                if value is not None:
+                    results[meas_type] = value
+
+        self._logger.debug(f"MATH{function_num} measurements: {results}")
+        return results
+
     def measure_multiple(self, channel: int, measurement_types: List[str]) -> Optional[Dict[str, float]]:
         """
         Perform multiple measurements on specified channel
@@ -817,6 +879,69 @@ class KeysightDSOX6004A:
             self._logger.error(f"Failed to query acquire points: {type(e).__name__}: {e}")
             return None
 
+    def batch_query(self, commands: List[str]) -> List[str]:
+        """
+        Send several queries as one program message and split the reply
+
+        The queries are joined with ';' (IEEE 488.2 compound message), so the
+        scope answers all of them in a single ';'-separated response: one bus
+        round-trip instead of len(commands). Queries whose replies can
+        themselves contain ';' must not be batched.
+
+        Args:
+            commands (List[str]): Full query headers, e.g. [":ACQuire:MODE?", ...]
+
+        Returns:
+            List[str]: Stripped reply fields, one per command, in order
+
+        Raises:
+            ValueError: If the reply does not hold exactly one field per query
+        """
+        reply = self._scpi_wrapper.query(";".join(commands)).strip().split(";")
+        if len(reply) != len(commands):
+            raise ValueError(f"Expected {len(commands)} reply fields, got {len(reply)}: {reply}")
+        return [field.strip() for field in reply]
+
+    def get_acquisition_info(self) -> Dict[str, Any]:
+        """
+        Query mode, type, count, sample rate and acquired points in one exchange
+
+        The five :ACQuire queries go out through batch_query() (one bus
+        round-trip instead of five). If the batched reply cannot be parsed,
+        the individual get_acquire_*() / get_sample_rate() queries are used
+        instead.
+
+        Returns:
+            Dict with keys 'mode', 'type', 'count', 'sample_rate', 'points';
+            a value is None where its query failed
+        """
+        info = {'mode': None, 'type': None, 'count': None, 'sample_rate': None, 'points': None}
+        if not self.is_connected:
+            return info
+
+        try:
+            # SCPI: :ACQuire:MODE? (pg 300), :TYPE? (pg 310), :COUNt? (pg 298),
+            #       :SRATe? (pg 309), :POINts? (pg 302)
+            mode, acq_type, count, rate, points = self.batch_query([
+                ":ACQuire:MODE?", ":ACQuire:TYPE?", ":ACQuire:COUNt?",
+                ":ACQuire:SRATe?", ":ACQuire:POINts?"
+            ])
+            info['mode'] = mode
+            info['type'] = acq_type
+            info['count'] = int(count)
+            info['sample_rate'] = float(rate)
+            info['points'] = int(points)
+            return info
+        except Exception as e:
+            self._logger.debug(f"Batched acquisition info query failed: {type(e).__name__}: {e}")
+
+        info['mode'] = self.get_acquire_mode()
+        info['type'] = self.get_acquire_type()
+        info['count'] = self.get_acquire_count()
+        info['sample_rate'] = self.get_sample_rate()
+        info['points'] = self.get_acquire_points()
+        return info
+
     # ============================================================================
     # TRIGGER CONFIGURATION - ADVANCED TRIGGER MODES (GLITCH, PULSE, etc.)
     # ============================================================================
@@ -1121,12 +1246,9 @@ class KeysightDSOX6004A:
                 except Exception as e:
                     self._logger.warning(f"Could not stop acquisition: {e}")
 
-            # SCPI: :WAVeform:SOURce (pg 1201)
-            self._scpi_wrapper.write(f":WAVeform:SOURce CHANnel{channel}")
-            time.sleep(0.1)
-
-            # SCPI: :WAVeform:FORMat (pg 1156)
-            self._scpi_wrapper.write(f":WAVeform:FORMat {format_type}")
+            # SCPI: :WAVeform:SOURce (pg 1201), :WAVeform:FORMat (pg 1156)
+            # Sent as one ';'-joined program message, followed by one settle delay
+            self._scpi_wrapper.write(f":WAVeform:SOURce CHANnel{channel};:WAVeform:FORMat {format_type}")
             time.sleep(0.1)
 
             # SCPI: :WAVeform:PREamble? (pg 1158)
@@ -1134,10 +1256,12 @@ class KeysightDSOX6004A:
             self._logger.debug(f"Waveform preamble: {preamble}")
 
             # SCPI: :WAVeform:DATA? (pg 1150)
-            data = self._scpi_wrapper.query_binary_values(":WAVeform:DATA?", datatype='B')
+            # container=np.ndarray: decoded straight into a uint8 array
+            data = self._scpi_wrapper.query_binary_values(":WAVeform:DATA?", datatype='B',
+                                                          container=np.ndarray)
 
-            if data:
-                waveform = np.array(data, dtype=np.uint8)
+            if data.size:
+                waveform = data
                 self._logger.info(f"Retrieved {len(waveform)} waveform points from CH{channel}")
 
                 # RESUME ACQUISITION: Restart the scope if it was running
@@ -1335,6 +1459,31 @@ class KeysightDSOX6004A:
             self._logger.error(f"Failed to get marker Y delta: {type(e).__name__}: {e}")
             return None
 
+    def get_marker_deltas(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get X and Y marker deltas in one exchange
+
+        Sends :MARKer:XDELta? and :MARKer:YDELta? through batch_query() (one
+        bus round-trip); falls back to get_marker_x_delta() and
+        get_marker_y_delta() if the batched reply cannot be parsed.
+
+        Returns:
+            Tuple[Optional[float], Optional[float]]: (time delta in s, voltage delta in V)
+        """
+        if not self.is_connected:
+            return None, None
+
+        try:
+            # SCPI: :MARKer:XDELta? (pg 609), :MARKer:YDELta? (pg 610)
+            x_delta, y_delta = self.batch_query([":MARKer:XDELta?", ":MARKer:YDELta?"])
+            x_delta, y_delta = float(x_delta), float(y_delta)
+            self._logger.debug(f"Marker deltas: {x_delta}s, {y_delta}V")
+            return x_delta, y_delta
+        except Exception as e:
+            self._logger.debug(f"Batched marker delta query failed: {type(e).__name__}: {e}")
+
+        return self.get_marker_x_delta(), self.get_marker_y_delta()
+
     # ============================================================================
     # MATH FUNCTIONS - FUNCtion SUBSYSTEM
     # ============================================================================
@@ -1768,12 +1917,13 @@ class KeysightDSOX6004A:
             self._logger.info(f"Capturing screenshot in {image_format} format")
             image_data = self._scpi_wrapper.query_binary_values(
                 f":DISPlay:DATA? {image_format}",
-                datatype='B'
+                datatype='B',
+                container=np.ndarray
             )
 
-            if image_data:
+            if image_data.size:
                 with open(screenshot_path, 'wb') as f:
-                    f.write(bytes(image_data))
+                    f.write(image_data)      # ndarray buffer, written without a bytes copy
                 self._logger.info(f"Screenshot saved: {screenshot_path}")
 
                 # RESUME ACQUISITION: Restart the scope if it was running
@@ -1811,6 +1961,29 @@ class KeysightDSOX6004A:
         for directory in [self.screenshot_dir, self.data_dir, self.graph_dir]:
             directory.mkdir(exist_ok=True)
 
+    @staticmethod
+    def _wgen_config_command(generator: int, waveform: str, frequency: float,
+                             amplitude: float, offset: float, enable: bool) -> str:
+        """
+        Build the ';'-joined WGEN program message used by configure_function_generator.
+
+        Pure string building with no I/O. The instrument executes the headers
+        in order, exactly as the former one-write-per-setting sequence did.
+        """
+        waveform = waveform.upper()
+        prefix = f":WGEN{generator}"
+        # SCPI: :WGEN:FUNCtion {SINusoid|SQUare|RAMP|...} (pg 1526)
+        parts = [f"{prefix}:FUNCtion {waveform}"]
+        if waveform != "DC":
+            # SCPI: :WGEN:FREQuency (pg 1525)
+            parts.append(f"{prefix}:FREQuency {frequency}")
+        # SCPI: :WGEN:VOLTage (pg 1557), :WGEN:VOLTage:OFFSet (pg 1560),
+        #       :WGEN:OUTPut {ON|OFF} (pg 1547)
+        parts.append(f"{prefix}:VOLTage {amplitude}")
+        parts.append(f"{prefix}:VOLTage:OFFSet {offset}")
+        parts.append(f"{prefix}:OUTPut {'ON' if enable else 'OFF'}")
+        return ";".join(parts)
+
     def configure_function_generator(self, generator: int, waveform: str = "SIN",
                                      frequency: float = 1000.0, amplitude: float = 1.0,
                                      offset: float = 0.0, enable: bool = True) -> bool:
@@ -1836,27 +2009,10 @@ class KeysightDSOX6004A:
             return False
 
         try:
-            # SCPI: :WGEN:FUNCtion {SINusoid|SQUare|RAMP|...} (pg 1526)
-            self._scpi_wrapper.write(f":WGEN{generator}:FUNCtion {waveform.upper()}")
-            time.sleep(0.05)
-
-            if waveform.upper() != "DC":
-                # SCPI: :WGEN:FREQuency (pg 1525)
-                self._scpi_wrapper.write(f":WGEN{generator}:FREQuency {frequency}")
-                time.sleep(0.05)
-
-            # SCPI: :WGEN:VOLTage (pg 1557)
-            self._scpi_wrapper.write(f":WGEN{generator}:VOLTage {amplitude}")
-            time.sleep(0.05)
-
-            # SCPI: :WGEN:VOLTage:OFFSet (pg 1560)
-            self._scpi_wrapper.write(f":WGEN{generator}:VOLTage:OFFSet {offset}")
-            time.sleep(0.05)
-
-            # SCPI: :WGEN:OUTPut {ON|OFF|} (pg 1547)
-            output_state = "ON" if enable else "OFF"
-            self._scpi_wrapper.write(f":WGEN{generator}:OUTPut {output_state}")
-            time.sleep(0.05)
+            # Whole configuration as one program message, one settle delay
+            self._scpi_wrapper.write(self._wgen_config_command(
+                generator, waveform, frequency, amplitude, offset, enable))
+            time.sleep(0.1)
 
             self._logger.info(f"WGEN{generator} configured: {waveform}, {frequency}Hz, {amplitude}Vpp")
             return True
@@ -1900,13 +2056,29 @@ class KeysightDSOX6004A:
             self._scpi_wrapper.query("*OPC?")
             time.sleep(0.05)
 
+            # All five settings in one batched exchange; per-query fallback
+            # if the compound reply cannot be split
+            queries = [
+                f":WGEN{generator}:FUNCtion?",
+                f":WGEN{generator}:FREQuency?",
+                f":WGEN{generator}:VOLTage?",
+                f":WGEN{generator}:VOLTage:OFFSet?",
+                f":WGEN{generator}:OUTPut?"
+            ]
+            try:
+                function, frequency, amplitude, offset, output = self.batch_query(queries)
+            except ValueError as e:
+                self._logger.debug(f"Batched WGEN{generator} query failed: {e}")
+                function, frequency, amplitude, offset, output = (
+                    self._scpi_wrapper.query(q).strip() for q in queries)
+
             config = {
                 'generator': generator,
-                'function': self._scpi_wrapper.query(f":WGEN{generator}:FUNCtion?").strip(),
-                'frequency': float(self._scpi_wrapper.query(f":WGEN{generator}:FREQuency?").strip()),
-                'amplitude': float(self._scpi_wrapper.query(f":WGEN{generator}:VOLTage?").strip()),
-                'offset': float(self._scpi_wrapper.query(f":WGEN{generator}:VOLTage:OFFSet?").strip()),
-                'output': self._scpi_wrapper.query(f":WGEN{generator}:OUTPut?").strip()
+                'function': function,
+                'frequency': float(frequency),
+                'amplitude': float(amplitude),
+                'offset': float(offset),
+                'output': output
             }
 
             return config
@@ -35,6 +35,8 @@ class SCPIWrapper:
         self._cleanup_connection()
 
     def _cleanup_connection(self) -> None:
+        # _is_connected is only True while _instrument is open, so the I/O
+        # guards below test this one flag (no probe, no property call)
         self._is_connected = False
         self._instrument = None
         self._resource_manager = None
@@ -44,35 +46,36 @@ class SCPIWrapper:
         return self._is_connected
 
     def write(self, command: str) -> None:
-        if not self.is_connected or not self._instrument:
+        if not self._is_connected:
             raise ConnectionError("Instrument not connected")
         self._instrument.write(command)
 
     def query(self, command: str) -> str:
-        if not self.is_connected or not self._instrument:
+        if not self._is_connected:
             raise ConnectionError("Instrument not connected")
         return self._instrument.query(command)
 
-    def query_binary_values(self, command: str, datatype='B', is_big_endian=False):
-        if not self.is_connected or not self._instrument:
+    def query_binary_values(self, command: str, datatype='B', is_big_endian=False, container=list):
+        if not self._is_connected:
             raise ConnectionError("Instrument not connected")
-        return self._instrument.query_binary_values(command, datatype=datatype, is_big_endian=is_big_endian)
+        return self._instrument.query_binary_values(command, datatype=datatype, is_big_endian=is_big_endian,
+                                                    container=container)
 
     def read_raw(self):
-        if not self.is_connected or not self._instrument:
+        if not self._is_connected:
             raise ConnectionError("Instrument not connected")
         return self._instrument.read_raw()
 
     def set_timeout(self, timeout_ms: int) -> None:
         """Set VISA timeout dynamically"""
-        if not self.is_connected or not self._instrument:
+        if not self._is_connected:
             raise ConnectionError("Instrument not connected")
         self._timeout_ms = timeout_ms
         self._instrument.timeout = timeout_ms
 
     def reset_timeout(self) -> None:
         """Reset timeout to default value"""
-        if not self.is_connected or not self._instrument:
+        if not self._is_connected:
             raise ConnectionError("Instrument not connected")
         self._timeout_ms = self._default_timeout_ms
         self._instrument.timeout = self._default_timeout_ms
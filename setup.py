@@ -35,6 +35,13 @@ setup(
         'huggingface_hub>=0.25.2,<1.0.0',
     ],
     extras_require={
+        'export': [
+            'pyarrow>=14.0.0',
+            'orjson>=3.9.0',
+        ],
+        'jit': [
+            'numba>=0.58.0',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',